@@ -1,12 +1,14 @@
 """
 Flask application factory for The Dreamer's Cave.
 """
-from flask import Flask, jsonify
-from flask_cors import CORS
+from flask import Flask, Response, request, jsonify
+from logging.handlers import QueueHandler, QueueListener
+import atexit
 import logging
+import queue
+import threading
 
 from app.config import get_config
-from app.utils.db import init_pool, close_connection
 
 
 def create_app(config_class=None):
@@ -26,33 +28,28 @@ def create_app(config_class=None):
         config_class = get_config()
     app.config.from_object(config_class)
 
+    # Serialize JSON (including jsonify) with orjson
+    from app.utils.json_provider import OrjsonProvider
+    app.json = OrjsonProvider(app)
+
     # Configure logging
-    logging.basicConfig(
-        level=logging.DEBUG if app.config.get('DEBUG') else logging.INFO,
-        format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
-    )
+    init_logging(app)
     logger = logging.getLogger(__name__)
-    logger.info(f"Starting TDC Backend v{app.config.get('APP_VERSION', 'unknown')}")
+    logger.info("Starting TDC Backend v%s", app.config.get('APP_VERSION', 'unknown'))
 
     # Initialize CORS
-    CORS(app, resources={
-        r"/api/*": {
-            "origins": ["http://localhost:5173", "http://localhost:3000",
-                       "https://thedreamerscave.club", "https://www.thedreamerscave.club"],
-            "methods": ["GET", "POST", "PUT", "PATCH", "DELETE", "OPTIONS"],
-            "allow_headers": ["Content-Type", "Authorization", "X-Requested-With"],
-            "supports_credentials": True
-        }
-    })
-
-    # Initialize database pool
-    with app.app_context():
-        try:
-            init_pool(app)
-        except Exception as e:
-            logger.error(f"Failed to initialize database: {e}")
-            # Don't raise - allow app to start even if DB is unavailable
-            # Health check will report the issue
+    init_cors(app)
+
+    # Initialize database pool (deferred to init_worker under gunicorn)
+    from app.utils.db import init_pool, close_connection
+    if not app.config.get('DB_POOL_DEFER_INIT'):
+        with app.app_context():
+            try:
+                init_pool(app)
+            except Exception as e:
+                logger.error("Failed to initialize database: %s", e)
+                # Don't raise - allow app to start even if DB is unavailable
+                # Health check will report the issue
 
     # Register teardown for database connections
     app.teardown_appcontext(close_connection)
@@ -68,6 +65,200 @@ def create_app(config_class=None):
     return app
 
 
+class _DroppingQueueHandler(QueueHandler):
+    """
+    QueueHandler that never blocks request threads on routine logging.
+
+    When the queue is full, records below WARNING are dropped. WARNING and
+    above wait up to block_timeout seconds for space (only the logging
+    thread waits) and are only dropped if the writer is stuck. Drops are counted and reported with a WARNING
+    record once the queue has room again.
+    """
+
+    def __init__(self, log_queue, block_timeout: float = 1.0):
+        super().__init__(log_queue)
+        self.block_timeout = block_timeout
+        self.dropped = 0
+        self._dropped_lock = threading.Lock()
+
+    def handle(self, record):
+        # Unlike Handler.handle, don't hold the handler lock around emit:
+        # queue.Queue is thread-safe, and a WARNING waiting for space must
+        # not block other threads' log calls.
+        rv = self.filter(record)
+        if isinstance(rv, logging.LogRecord):
+            record = rv
+        if rv:
+            self.emit(record)
+        return rv
+
+    def enqueue(self, record):
+        try:
+            if record.levelno >= logging.WARNING:
+                self.queue.put(record, timeout=self.block_timeout)
+            else:
+                self.queue.put_nowait(record)
+        except queue.Full:
+            with self._dropped_lock:
+                self.dropped += 1
+            return
+        if self.dropped:
+            self._report_dropped()
+
+    def _report_dropped(self):
+        with self._dropped_lock:
+            count = self.dropped
+            if not count:
+                return
+            record = logging.LogRecord(
+                __name__, logging.WARNING, __file__, 0,
+                "Dropped %d log records (log queue full)", (count,), None,
+            )
+            try:
+                self.queue.put_nowait(record)
+            except queue.Full:
+                return
+            self.dropped -= count
+
+
+# Background thread writing queued log records (started by init_logging)
+_log_listener = None
+
+
+def init_logging(app):
+    """
+    Configure root logging.
+
+    Request threads merge each record's message (QueueHandler.prepare)
+    and put it on a bounded queue; a background QueueListener applies the
+    output format and does the stderr I/O, so slow log output never
+    stalls request handling. See _DroppingQueueHandler for what happens
+    when the queue is full. Like logging.basicConfig, does nothing if the
+    root logger already has handlers.
+
+    Args:
+        app: Flask application instance
+    """
+    global _log_listener
+
+    root = logging.getLogger()
+    if root.handlers:
+        return
+    root.setLevel(logging.DEBUG if app.config.get('DEBUG') else logging.INFO)
+
+    stream_handler = logging.StreamHandler()
+    stream_handler.setFormatter(
+        logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s')
+    )
+
+    log_queue = queue.Queue(maxsize=app.config.get('LOG_QUEUE_SIZE', 10000))
+    root.addHandler(_DroppingQueueHandler(log_queue))
+    _log_listener = QueueListener(log_queue, stream_handler, respect_handler_level=True)
+    _log_listener.start()
+    # Flush pending records on interpreter exit
+    atexit.register(_log_listener.stop)
+
+
+def _restart_log_listener():
+    """Start a fresh log writer thread if it didn't survive fork."""
+    global _log_listener
+
+    if _log_listener is None:
+        return
+    if _log_listener._thread is not None and _log_listener._thread.is_alive():
+        # Not forked (app loaded in this process), the writer is running
+        return
+
+    old_listener = _log_listener
+    atexit.unregister(old_listener.stop)
+
+    log_queue = queue.Queue(maxsize=old_listener.queue.maxsize)
+    for handler in logging.getLogger().handlers:
+        if isinstance(handler, _DroppingQueueHandler):
+            handler.queue = log_queue
+    _log_listener = QueueListener(log_queue, *old_listener.handlers, respect_handler_level=True)
+    _log_listener.start()
+    atexit.register(_log_listener.stop)
+
+
+def init_worker(app):
+    """
+    Open per-process resources in a gunicorn worker.
+
+    With gunicorn preload_app, create_app runs once in the master and
+    workers are forked from it. Sockets and threads don't survive fork,
+    so the master skips the pool (DB_POOL_DEFER_INIT) and each worker
+    opens its own pool here, and restarts the log writer thread.
+    Called from the post_worker_init hook in gunicorn.conf.py.
+
+    Args:
+        app: Flask application instance
+    """
+    from app.utils.db import init_pool
+
+    _restart_log_listener()
+
+    with app.app_context():
+        try:
+            init_pool(app)
+        except Exception as e:
+            logging.getLogger(__name__).error("Failed to initialize database: %s", e)
+
+
+def init_cors(app):
+    """
+    Configure CORS for /api/* routes.
+
+    The allowed origins are a small fixed set, so matching is a frozenset
+    lookup. Preflight (OPTIONS) responses only depend on the Origin
+    header: their headers are computed once per allowed origin at startup
+    and served from a before_request hook.
+
+    Args:
+        app: Flask application instance
+    """
+    allowed_origins = frozenset(app.config['CORS_ORIGINS'])
+    methods = ', '.join(app.config['CORS_METHODS'])
+    allow_headers = ', '.join(app.config['CORS_ALLOW_HEADERS'])
+    max_age = str(app.config['CORS_MAX_AGE'])
+
+    preflight_headers = {
+        origin: (
+            ('Access-Control-Allow-Origin', origin),
+            ('Access-Control-Allow-Methods', methods),
+            ('Access-Control-Allow-Headers', allow_headers),
+            ('Access-Control-Allow-Credentials', 'true'),
+            ('Access-Control-Max-Age', max_age),
+            ('Vary', 'Origin'),
+        )
+        for origin in allowed_origins
+    }
+
+    @app.before_request
+    def handle_preflight():
+        if request.method != 'OPTIONS' or not request.path.startswith('/api/'):
+            return None
+        origin = request.headers.get('Origin')
+        if origin is None:
+            return None
+
+        headers = preflight_headers.get(origin)
+        if headers is None:
+            return Response(status=403)
+        return Response(status=204, headers=headers)
+
+    @app.after_request
+    def add_cors_headers(response):
+        if not request.path.startswith('/api/'):
+            return response
+        response.vary.add('Origin')
+        origin = request.headers.get('Origin')
+        if origin in allowed_origins:
+            response.headers['Access-Control-Allow-Origin'] = origin
+            response.headers['Access-Control-Allow-Credentials'] = 'true'
+        return response
+
+
 def register_error_handlers(app):
     """
     Register global error handlers.
@@ -75,7 +266,15 @@ def register_error_handlers(app):
     Args:
         app: Flask application instance
     """
-    from app.utils.responses import error, not_found, server_error
+    from app.utils.responses import error, canned_error
+
+    # Bodies are serialized once; handlers only wrap them in a Response
+    unauthorized_response = canned_error("Unauthorized", 401)
+    forbidden_response = canned_error("Forbidden", 403)
+    not_found_response = canned_error("Resource not found", 404)
+    method_not_allowed_response = canned_error("Method not allowed", 405)
+    server_error_response = canned_error("Internal server error", 500)
+    unexpected_error_response = canned_error("An unexpected error occurred", 500)
 
     @app.errorhandler(400)
     def handle_400(e):
@@ -83,26 +282,26 @@ def register_error_handlers(app):
 
     @app.errorhandler(401)
     def handle_401(e):
-        return error("Unauthorized", 401)
+        return unauthorized_response()
 
     @app.errorhandler(403)
     def handle_403(e):
-        return error("Forbidden", 403)
+        return forbidden_response()
 
     @app.errorhandler(404)
     def handle_404(e):
-        return not_found("Resource not found")
+        return not_found_response()
 
     @app.errorhandler(405)
     def handle_405(e):
-        return error("Method not allowed", 405)
+        return method_not_allowed_response()
 
     @app.errorhandler(500)
     def handle_500(e):
-        app.logger.error(f"Internal server error: {e}")
-        return server_error("Internal server error")
+        app.logger.error("Internal server error: %s", e)
+        return server_error_response()
 
     @app.errorhandler(Exception)
     def handle_exception(e):
-        app.logger.exception(f"Unhandled exception: {e}")
-        return server_error("An unexpected error occurred")
+        app.logger.exception("Unhandled exception: %s", e)
+        return unexpected_error_response()
@@ -3,10 +3,13 @@ Flask application configuration.
 Loads settings from environment variables with sensible defaults.
 """
 import os
-from dotenv import load_dotenv
 
-# Load .env file
-load_dotenv()
+# Load .env file, except when the process environment already says it is
+# production: there the orchestrator (systemd/docker) provides every
+# variable and python-dotenv isn't imported at all.
+if os.environ.get('FLASK_ENV') != 'production':
+    from dotenv import load_dotenv
+    load_dotenv()
 
 
 class Config:
@@ -24,10 +27,24 @@ class Config:
     DB_USER = os.environ.get('DB_USER', 'tdcweb')
     DB_PASSWORD = os.environ.get('DB_PASSWORD', 'tdcweb')
     DB_POOL_SIZE = int(os.environ.get('DB_POOL_SIZE', 10))
+    DB_POOL_WARMUP = os.environ.get('DB_POOL_WARMUP', 'true').lower() == 'true'
+    DB_POOL_WARMUP_PARALLEL = os.environ.get('DB_POOL_WARMUP_PARALLEL', 'true').lower() == 'true'
+    # Skip the pool in create_app; init_worker opens it (set by gunicorn.conf.py)
+    DB_POOL_DEFER_INIT = os.environ.get('DB_POOL_DEFER_INIT', 'false').lower() == 'true'
 
     # Redis
     REDIS_URL = os.environ.get('REDIS_URL', 'redis://localhost:6379/0')
 
+    # CORS
+    CORS_ORIGINS = os.environ.get(
+        'CORS_ORIGINS',
+        'http://localhost:5173,http://localhost:3000,'
+        'https://thedreamerscave.club,https://www.thedreamerscave.club'
+    ).split(',')
+    CORS_METHODS = ['GET', 'POST', 'PUT', 'PATCH', 'DELETE', 'OPTIONS']
+    CORS_ALLOW_HEADERS = ['Content-Type', 'Authorization', 'X-Requested-With']
+    CORS_MAX_AGE = int(os.environ.get('CORS_MAX_AGE', 86400))  # Browser preflight cache (seconds)
+
     # Email
     MAIL_SERVER = os.environ.get('MAIL_SERVER', 'localhost')
     MAIL_PORT = int(os.environ.get('MAIL_PORT', 587))
@@ -70,9 +87,13 @@ class Config:
 
     # Application
     DEFAULT_LANGUAGE = os.environ.get('DEFAULT_LANGUAGE', 'en')
-    SUPPORTED_LANGUAGES = os.environ.get('SUPPORTED_LANGUAGES', 'en,it,fr,es').split(',')
+    # frozenset: only used for membership tests during language negotiation
+    SUPPORTED_LANGUAGES = frozenset(os.environ.get('SUPPORTED_LANGUAGES', 'en,it,fr,es').split(','))
     BASE_URL = os.environ.get('BASE_URL', 'http://localhost:5000')
 
+    # Logging - max records buffered for the background log writer
+    LOG_QUEUE_SIZE = int(os.environ.get('LOG_QUEUE_SIZE', 10000))
+
     # App version
     APP_VERSION = '0.1.0'
 
@@ -97,6 +118,7 @@ class TestingConfig(Config):
     DEBUG = True
     TESTING = True
     DB_NAME = os.environ.get('DB_NAME_TEST', 'tdcweb_test')
+    DB_POOL_WARMUP = False
 
 
 # Configuration mapping
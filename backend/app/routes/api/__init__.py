@@ -2,11 +2,19 @@
 Public API routes blueprint.
 All endpoints under /api/v1/
 """
+import importlib
 from flask import Blueprint
 
 # Main API blueprint
 api_bp = Blueprint('api', __name__, url_prefix='/api/v1')
 
+# Sub-blueprint modules, imported only when routes are registered so that
+# importing this package doesn't load OAuth/Patreon/Facebook SDKs.
+# Each module must expose a `bp` Blueprint.
+API_MODULES = (
+    'app.routes.api.health',
+)
+
 
 def register_api_routes(app):
     """
@@ -15,10 +23,10 @@ def register_api_routes(app):
     Args:
         app: Flask application instance
     """
-    from app.routes.api import health
-
     # Register sub-blueprints
-    api_bp.register_blueprint(health.bp)
+    for module_name in API_MODULES:
+        module = importlib.import_module(module_name)
+        api_bp.register_blueprint(module.bp)
 
     # Register main API blueprint with app
     app.register_blueprint(api_bp)
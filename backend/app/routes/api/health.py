@@ -1,14 +1,81 @@
 """
 Health check endpoints for monitoring and load balancer health checks.
 """
-from flask import Blueprint
-from datetime import datetime, timezone
+import threading
+import time
+from time import gmtime, strftime
+from concurrent.futures import ThreadPoolExecutor, as_completed, TimeoutError
+from flask import Blueprint, Response, request
 from app.config import Config
 from app.utils.responses import success, error
 from app.utils.db import test_connection
 
 bp = Blueprint('health', __name__)
 
+# Constant part of the /health payload, built once at import
+_STATIC = {"status": "ok", "version": Config.APP_VERSION}
+
+# (epoch second, payload) - /health payload reused within the same second
+_health_cache = (0, None)
+
+_ISO_FMT = '%Y-%m-%dT%H:%M:%S'
+
+# (epoch second, formatted second) - strftime runs at most once per second
+_ts_cache = (-1, '')
+
+# Component name -> probe returning True when healthy, run concurrently by
+# /health/full. Probes run outside the request context.
+# TODO: Add Redis health check when Celery is configured
+HEALTH_CHECKS = {
+    "database": test_connection,
+}
+
+# /health ETag changes every ETAG_BUCKET seconds (and on version change)
+ETAG_BUCKET = 5
+
+# Seconds /health/full waits for all probes before reporting them as "error"
+HEALTH_CHECK_TIMEOUT = 2.0
+
+# Reused across requests to avoid spawning threads per probe
+_health_pool = ThreadPoolExecutor(max_workers=4, thread_name_prefix='health')
+
+# Component name -> future of its most recent probe. A probe still running
+# (e.g. a hung database) is shared by later requests instead of submitting
+# another one, so timed-out probes can't pile up on _health_pool.
+_inflight = {}
+_inflight_lock = threading.Lock()
+
+
+def _submit_check(name: str, check):
+    """Start a probe for `name`, or return the one still in flight."""
+    with _inflight_lock:
+        future = _inflight.get(name)
+        if future is None or future.done():
+            future = _inflight[name] = _health_pool.submit(check)
+        return future
+
+
+def _utcnow_iso(t: float = None) -> str:
+    """
+    Current UTC time as ISO 8601 with millisecond precision.
+
+    Args:
+        t: Epoch seconds (default: time.time())
+
+    Returns:
+        str: e.g. "2025-01-08T20:00:00.000Z"
+    """
+    global _ts_cache
+
+    if t is None:
+        t = time.time()
+    second = int(t)
+    cached_second, formatted = _ts_cache
+    if cached_second != second:
+        formatted = strftime(_ISO_FMT, gmtime(second))
+        _ts_cache = (second, formatted)
+    return f"{formatted}.{int((t - second) * 1000):03d}Z"
+
 
 @bp.route('/health', methods=['GET'])
 def health_check():
@@ -28,11 +95,31 @@ def health_check():
             }
         }
     """
-    return success({
-        "status": "ok",
-        "version": Config.APP_VERSION,
-        "timestamp": datetime.now(timezone.utc).isoformat()
-    })
+    global _health_cache
+
+    now = time.time()
+
+    # Weak ETag, stable for ETAG_BUCKET seconds: conditional probes get an
+    # empty 304 without building or encoding the payload
+    etag = f"{Config.APP_VERSION}-{int(now // ETAG_BUCKET)}"
+    if request.if_none_match.contains_weak(etag):
+        response = Response(status=304)
+        response.set_etag(etag, weak=True)
+        response.cache_control.max_age = 1
+        return response
+
+    second = int(now)
+    cached_second, payload = _health_cache
+    if payload is None or cached_second != second:
+        payload = _STATIC.copy()
+        payload["timestamp"] = _utcnow_iso(now)
+        _health_cache = (second, payload)
+
+    response, status_code = success(payload)
+    response.set_etag(etag, weak=True)
+    # Let probes/proxies reuse the answer for up to a second
+    response.cache_control.max_age = 1
+    return response, status_code
 
 
 @bp.route('/health/db', methods=['GET'])
@@ -65,7 +152,7 @@ def health_check_db():
         return success({
             "status": "ok",
             "database": "connected",
-            "timestamp": datetime.now(timezone.utc).isoformat()
+            "timestamp": _utcnow_iso()
         })
     else:
         return error("Database connection failed", 503)
@@ -93,12 +180,18 @@ def health_check_full():
             }
         }
     """
-    components = {
-        "database": "ok" if test_connection() else "error"
-    }
-
-    # TODO: Add Redis health check when Celery is configured
-    # components["redis"] = "ok" if redis_ok else "error"
+    # Unfinished probes stay "error"
+    components = {name: "error" for name in HEALTH_CHECKS}
+    futures = {_submit_check(name, check): name for name, check in HEALTH_CHECKS.items()}
+    try:
+        for future in as_completed(futures, timeout=HEALTH_CHECK_TIMEOUT):
+            try:
+                ok = future.result()
+            except Exception:
+                ok = False
+            components[futures[future]] = "ok" if ok else "error"
+    except TimeoutError:
+        pass
 
     overall_status = "ok" if all(v == "ok" for v in components.values()) else "degraded"
 
@@ -106,5 +199,5 @@ def health_check_full():
         "status": overall_status,
         "version": Config.APP_VERSION,
         "components": components,
-        "timestamp": datetime.now(timezone.utc).isoformat()
+        "timestamp": _utcnow_iso()
     })
@@ -1,26 +1,78 @@
 """
 Utility modules for the TDC application.
+
+Submodules are imported lazily on first attribute access (PEP 562), so
+importing a single utility (e.g. app.utils.responses) doesn't pull in
+mysql.connector or any other heavy dependency it doesn't need.
 """
-from app.utils.db import get_cursor, fetch_one, fetch_all, execute, execute_many
-from app.utils.responses import success, error, created, no_content, paginated
-from app.utils.responses import not_found, unauthorized, forbidden, bad_request, server_error
+import importlib
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from app.utils.db import get_cursor, fetch_one, fetch_all, fetch_all_cached, fetch_iter
+    from app.utils.db import execute, execute_many, invalidate
+    from app.utils.responses import success, error, created, no_content, paginated, stream_ndjson
+    from app.utils.responses import not_found, unauthorized, forbidden, bad_request, server_error
+
+# Public name -> submodule that defines it
+_LAZY_ATTRS = {
+    # Database utilities
+    'get_cursor': 'app.utils.db',
+    'fetch_one': 'app.utils.db',
+    'fetch_all': 'app.utils.db',
+    'fetch_all_cached': 'app.utils.db',
+    'fetch_iter': 'app.utils.db',
+    'execute': 'app.utils.db',
+    'execute_many': 'app.utils.db',
+    'invalidate': 'app.utils.db',
+    # Response helpers
+    'success': 'app.utils.responses',
+    'error': 'app.utils.responses',
+    'created': 'app.utils.responses',
+    'no_content': 'app.utils.responses',
+    'paginated': 'app.utils.responses',
+    'stream_ndjson': 'app.utils.responses',
+    'not_found': 'app.utils.responses',
+    'unauthorized': 'app.utils.responses',
+    'forbidden': 'app.utils.responses',
+    'bad_request': 'app.utils.responses',
+    'server_error': 'app.utils.responses',
+}
 
 __all__ = [
     # Database utilities
     'get_cursor',
     'fetch_one',
     'fetch_all',
+    'fetch_all_cached',
+    'fetch_iter',
     'execute',
     'execute_many',
+    'invalidate',
     # Response helpers
     'success',
     'error',
     'created',
     'no_content',
     'paginated',
+    'stream_ndjson',
     'not_found',
     'unauthorized',
     'forbidden',
     'bad_request',
     'server_error',
 ]
+
+
+def __getattr__(name):
+    module_name = _LAZY_ATTRS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    attr = getattr(importlib.import_module(module_name), name)
+    # Cache so later lookups bypass __getattr__
+    globals()[name] = attr
+    return attr
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
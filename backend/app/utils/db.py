@@ -6,30 +6,61 @@ NO SQLAlchemy - uses mysql-connector-python directly with parameterized queries.
 """
 import mysql.connector
 from mysql.connector import pooling
+from cachetools import TLRUCache
 from flask import g
+from collections.abc import Mapping
 from contextlib import contextmanager
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 import logging
+import threading
 
 logger = logging.getLogger(__name__)
 
 # Connection pool (initialized once)
 _pool = None
 
+# Connection arguments, kept for connections opened outside the pool
+_db_config = None
+
+# Dedicated connection for health probes, so they never take a pool slot
+_health_conn = None
+_health_lock = threading.Lock()
+
+# Health probes must fail fast rather than hang a load balancer check.
+# Bounds the connect, the ping and the wait for a concurrent probe; keep it
+# no larger than the /health/full deadline (HEALTH_CHECK_TIMEOUT).
+HEALTH_CONNECT_TIMEOUT = 2
+
+# Result cache for fetch_all_cached. Values are (ttl, rows) and each entry
+# expires ttl seconds after it was stored, so one bounded cache serves
+# every ttl value.
+QUERY_CACHE_SIZE = 1024
+_query_cache = TLRUCache(maxsize=QUERY_CACHE_SIZE, ttu=lambda key, value, now: now + value[0])
+_query_cache_lock = threading.RLock()
+
 
 def init_pool(app):
     """
     Initialize the connection pool.
     Call from app factory after loading configuration.
 
+    Sessions are NOT reset when a connection returns to the pool (saves a
+    round-trip per request). Code that changes session state (SET SESSION,
+    user variables, temporary tables) must undo it before the connection
+    is released, or use a dedicated non-pooled connection.
+
     Args:
         app: Flask application instance
     """
-    global _pool
+    global _pool, _db_config
 
     pool_config = {
         'pool_name': 'tdc_pool',
         'pool_size': app.config.get('DB_POOL_SIZE', 10),
-        'pool_reset_session': True,
+        'pool_reset_session': False,
+    }
+    db_config = {
         'host': app.config['DB_HOST'],
         'port': app.config['DB_PORT'],
         'database': app.config['DB_NAME'],
@@ -40,15 +71,124 @@ def init_pool(app):
         'autocommit': False,
         'connection_timeout': 30
     }
+    _db_config = db_config
 
     try:
-        _pool = pooling.MySQLConnectionPool(**pool_config)
-        logger.info(f"Database pool initialized: {app.config['DB_NAME']}@{app.config['DB_HOST']}")
+        if app.config.get('DB_POOL_WARMUP', True):
+            pool = pooling.MySQLConnectionPool(**pool_config)
+            pool.set_config(**db_config)
+            _warmup_pool(
+                pool, db_config,
+                parallel=app.config.get('DB_POOL_WARMUP_PARALLEL', True)
+            )
+        else:
+            pool = pooling.MySQLConnectionPool(**pool_config, **db_config)
+        _pool = pool
+        logger.info("Database pool initialized: %s@%s", app.config['DB_NAME'], app.config['DB_HOST'])
     except mysql.connector.Error as e:
-        logger.error(f"Failed to initialize database pool: {e}")
+        logger.error("Failed to initialize database pool: %s", e)
         raise
 
 
+def _open_warm_connection(db_config: dict):
+    """Open a connection and run a trivial query so the session is fully established."""
+    conn = mysql.connector.connect(**db_config)
+    try:
+        cursor = conn.cursor()
+        cursor.execute("SELECT 1")
+        cursor.fetchall()
+        cursor.close()
+    except mysql.connector.Error:
+        conn.close()
+        raise
+    return conn
+
+
+def _warmup_pool(pool, db_config: dict, parallel: bool = True):
+    """
+    Fill an empty pool with warm connections.
+
+    MySQLConnectionPool opens its connections one by one while holding a
+    global lock; here the connect + auth handshakes can overlap instead.
+    Slots that fail to connect are filled with unconnected connections,
+    which the pool reconnects lazily on first checkout, so a partial DB
+    outage does not shrink the pool or block app startup. One by one,
+    warmup stops at the first failed connect.
+
+    Args:
+        pool: MySQLConnectionPool created without connection arguments
+        db_config: Connection arguments (host, user, database, ...)
+        parallel: Open connections concurrently (True) or one by one (False)
+
+    Raises:
+        mysql.connector.Error: If no connection could be opened at all
+    """
+    size = pool.pool_size
+    if parallel and size > 1:
+        with ThreadPoolExecutor(max_workers=size) as executor:
+            futures = [executor.submit(_open_warm_connection, db_config) for _ in range(size)]
+            results = []
+            for future in futures:
+                try:
+                    results.append(future.result())
+                except mysql.connector.Error as e:
+                    results.append(e)
+    else:
+        results = []
+        for _ in range(size):
+            try:
+                results.append(_open_warm_connection(db_config))
+            except mysql.connector.Error as e:
+                # Stop at the first failure: against an unreachable host each
+                # further attempt would wait out the full connection_timeout.
+                # The remaining slots become placeholders like failed ones.
+                results.extend([e] * (size - len(results)))
+                break
+
+    failures = [r for r in results if isinstance(r, Exception)]
+    if len(failures) == size:
+        raise failures[0]
+
+    for result in results:
+        if isinstance(result, Exception):
+            # Unconnected placeholder: the pool reconnects it on checkout
+            result = mysql.connector.connect()
+        else:
+            # Mark as matching the pool config, otherwise the pool
+            # reconnects it on first checkout and the warmup is wasted
+            result.pool_config_version = pool._config_version
+        pool.add_connection(result)
+
+    if failures:
+        logger.warning("Database pool warmup incomplete: %d/%d connections (%s)",
+                       size - len(failures), size, failures[0])
+    else:
+        logger.info("Database pool warmed: %d connections", size)
+
+
+def close_pool():
+    """
+    Close all pooled connections and the health probe connection.
+
+    Called in the gunicorn master before forking workers, so that workers
+    don't inherit (and share) its MySQL sockets. See gunicorn.conf.py.
+    """
+    global _pool, _health_conn
+
+    if _pool is not None:
+        _pool._remove_connections()
+        _pool = None
+        logger.info("Database pool closed")
+
+    with _health_lock:
+        if _health_conn is not None:
+            try:
+                _health_conn.close()
+            except Exception:
+                pass
+            _health_conn = None
+
+
 def get_pool():
     """Get the connection pool instance."""
     global _pool
@@ -80,14 +220,22 @@ def close_connection(e=None):
     """
     conn = g.pop('db_conn', None)
     if conn is not None:
+        try:
+            # The pool doesn't reset sessions: never hand an open transaction
+            # (uncommitted writes, or the read snapshot left by readonly
+            # SELECTs) to the next request. in_transaction is a local flag.
+            if conn.in_transaction:
+                conn.rollback()
+        except mysql.connector.Error as e:
+            logger.warning("Error rolling back database connection: %s", e)
         try:
             conn.close()
         except mysql.connector.Error as e:
-            logger.warning(f"Error closing database connection: {e}")
+            logger.warning("Error closing database connection: %s", e)
 
 
 @contextmanager
-def get_cursor(dictionary=True, buffered=True):
+def get_cursor(dictionary=True, buffered=True, readonly=False):
     """
     Context manager for database cursor with automatic transaction handling.
 
@@ -99,6 +247,7 @@ def get_cursor(dictionary=True, buffered=True):
     Args:
         dictionary: Return dict rows (True) or tuple rows (False)
         buffered: Buffer results (True) or use server-side cursor (False)
+        readonly: Block only runs SELECTs - skip COMMIT/ROLLBACK round-trips
 
     Yields:
         MySQLCursor instance
@@ -108,6 +257,14 @@ def get_cursor(dictionary=True, buffered=True):
     """
     conn = get_connection()
     cursor = conn.cursor(dictionary=dictionary, buffered=buffered)
+    if readonly:
+        # Nothing to commit or roll back for pure reads
+        try:
+            yield cursor
+        finally:
+            cursor.close()
+        return
+
     try:
         yield cursor
         conn.commit()
@@ -120,7 +277,7 @@ def get_cursor(dictionary=True, buffered=True):
 
 def fetch_one(query: str, params: tuple = None, dictionary: bool = True):
     """
-    Execute query and return single row.
+    Execute a read-only query and return single row.
 
     Args:
         query: SQL query with %s placeholders
@@ -136,14 +293,14 @@ def fetch_one(query: str, params: tuple = None, dictionary: bool = True):
             (user_id,)
         )
     """
-    with get_cursor(dictionary=dictionary) as cursor:
+    with get_cursor(dictionary=dictionary, readonly=True) as cursor:
         cursor.execute(query, params or ())
         return cursor.fetchone()
 
 
 def fetch_all(query: str, params: tuple = None, dictionary: bool = True):
     """
-    Execute query and return all rows.
+    Execute a read-only query and return all rows.
 
     Args:
         query: SQL query with %s placeholders
@@ -159,11 +316,145 @@ def fetch_all(query: str, params: tuple = None, dictionary: bool = True):
             (True,)
         )
     """
-    with get_cursor(dictionary=dictionary) as cursor:
+    with get_cursor(dictionary=dictionary, readonly=True) as cursor:
         cursor.execute(query, params or ())
         return cursor.fetchall()
 
 
+def fetch_all_cached(query: str, params=None, dictionary: bool = True, ttl: int = 60):
+    """
+    fetch_all with an in-process TTL cache keyed on (query, params).
+
+    For near-static reference data read on every page load (locations,
+    tags, taxonomies). The cache is per worker process: after writing to
+    a cached table call invalidate(), and expect other workers to serve
+    stale rows for up to `ttl` seconds.
+
+    Returned rows are shared between callers - don't mutate them.
+
+    Args:
+        query: SQL query with %s placeholders
+        params: Tuple of parameters, or dict for %(name)s placeholders
+        dictionary: Return list of dicts (True) or tuples (False)
+        ttl: Seconds a result stays cached
+
+    Returns:
+        list of dict or tuple
+
+    Example:
+        locations = fetch_all_cached(
+            "SELECT * FROM locations WHERE is_active = %s ORDER BY sort_order",
+            (True,),
+            ttl=300
+        )
+    """
+    key = (query, _params_key(params), dictionary)
+    with _query_cache_lock:
+        entry = _query_cache.get(key)
+    if entry is not None:
+        return entry[1]
+
+    # Query outside the lock so a slow query doesn't block other cache hits
+    rows = fetch_all(query, params, dictionary)
+    with _query_cache_lock:
+        _query_cache[key] = (ttl, rows)
+    return rows
+
+
+def _params_key(params) -> tuple:
+    """Hashable cache key for query params (tuple/list or dict)."""
+    if not params:
+        return ()
+    if isinstance(params, Mapping):
+        # tuple(dict) would keep only the names, not the values
+        return tuple(sorted(params.items()))
+    return tuple(params)
+
+
+def invalidate(pattern: str = None) -> int:
+    """
+    Drop cached fetch_all_cached results (current worker process only).
+
+    Args:
+        pattern: Drop entries whose query contains this text, case-insensitive
+                 (typically a table name). None drops everything.
+
+    Returns:
+        Number of entries dropped
+
+    Example:
+        execute("UPDATE locations SET name = %s WHERE id = %s", (name, location_id))
+        invalidate("locations")
+    """
+    with _query_cache_lock:
+        if pattern is None:
+            dropped = len(_query_cache)
+            _query_cache.clear()
+            return dropped
+        needle = pattern.lower()
+        keys = [k for k in _query_cache.keys() if needle in k[0].lower()]
+        for key in keys:
+            _query_cache.pop(key, None)
+    return len(keys)
+
+
+def fetch_iter(query: str, params: tuple = None, dictionary: bool = True, arraysize: int = 1000):
+    """
+    Execute a read-only query and yield rows one by one.
+
+    Uses an unbuffered (server-side) cursor and pulls rows in batches of
+    `arraysize`, so memory stays constant regardless of result size.
+    The request connection is busy until the generator is exhausted or
+    closed - don't run other queries on it while iterating.
+
+    Args:
+        query: SQL query with %s placeholders
+        params: Tuple of parameters
+        dictionary: Yield dicts (True) or tuples (False)
+        arraysize: Rows fetched from the server per round-trip
+
+    Yields:
+        dict or tuple per row
+
+    Example:
+        return stream_ndjson(fetch_iter(
+            "SELECT * FROM patrons WHERE is_active = %s",
+            (True,)
+        ))
+    """
+    conn = get_connection()
+    cursor = conn.cursor(dictionary=dictionary, buffered=False)
+    try:
+        cursor.execute(query, params or ())
+        while True:
+            rows = cursor.fetchmany(arraysize)
+            if not rows:
+                break
+            yield from rows
+    finally:
+        # Consumer stopped early (break, client disconnect, error): the rest
+        # of the result set is still pending on the connection. Errors here
+        # are logged, not raised, so they don't replace the original exception.
+        try:
+            _discard_unread(conn, cursor, arraysize)
+            cursor.close()
+        except mysql.connector.Error as e:
+            logger.warning("Error discarding unread rows: %s", e)
+
+
+def _discard_unread(conn, cursor, arraysize: int):
+    """Read and drop any pending rows in batches, keeping memory constant."""
+    while conn.unread_result:
+        if not cursor.fetchmany(arraysize):
+            break
+
+
+@lru_cache(maxsize=512)
+def _is_insert(query: str) -> bool:
+    """Check if query is an INSERT, looking only at its first keyword."""
+    return query.lstrip()[:6].upper() == 'INSERT'
+
+
 def execute(query: str, params: tuple = None) -> int:
     """
     Execute INSERT/UPDATE/DELETE and return affected rows or last insert ID.
@@ -191,7 +482,7 @@ def execute(query: str, params: tuple = None) -> int:
     """
     with get_cursor() as cursor:
         cursor.execute(query, params or ())
-        if query.strip().upper().startswith('INSERT'):
+        if _is_insert(query):
             return cursor.lastrowid
         return cursor.rowcount
 
@@ -222,12 +513,39 @@ def test_connection() -> bool:
     """
     Test database connectivity.
 
+    Pings the server (COM_PING) over a dedicated connection instead of
+    running a query through the pool, so frequent health probes neither
+    occupy pool slots nor pay for a query round-trip.
+
     Returns:
         True if connection successful, False otherwise
     """
+    global _health_conn
+
+    if _db_config is None:
+        logger.error("Database connection test failed: Database pool not initialized. Call init_pool first.")
+        return False
+
+    # Another probe is still waiting on the server: report failure instead
+    # of queueing behind it
+    if not _health_lock.acquire(timeout=HEALTH_CONNECT_TIMEOUT):
+        logger.error("Database connection test failed: previous probe still running")
+        return False
     try:
-        result = fetch_one("SELECT 1 as connected")
-        return result is not None and result.get('connected') == 1
+        if _health_conn is None:
+            _health_conn = mysql.connector.connect(
+                **{**_db_config, 'connection_timeout': HEALTH_CONNECT_TIMEOUT}
+            )
+        _health_conn.ping(reconnect=True, attempts=1, delay=0)
+        return True
     except Exception as e:
-        logger.error(f"Database connection test failed: {e}")
+        logger.error("Database connection test failed: %s", e)
+        if _health_conn is not None:
+            try:
+                _health_conn.close()
+            except Exception:
+                pass
+            _health_conn = None
         return False
+    finally:
+        _health_lock.release()
@@ -0,0 +1,56 @@
+"""
+JSON serialization backed by orjson.
+
+Used directly by the response helpers and installed as the Flask JSON
+provider, so jsonify() and request.get_json() also go through orjson.
+
+Type handling:
+    datetime/date/time: ISO 8601 (naive datetimes are treated as UTC, "Z" suffix)
+    Decimal:            string (same as Flask's default provider)
+    UUID/dataclass:     native orjson support
+"""
+import decimal
+from typing import Any
+
+import orjson
+from flask.json.provider import JSONProvider
+
+OPTIONS = orjson.OPT_NAIVE_UTC | orjson.OPT_UTC_Z | orjson.OPT_NON_STR_KEYS
+
+
+def _default(obj):
+    """Serialize types orjson doesn't handle natively."""
+    if isinstance(obj, decimal.Decimal):
+        return str(obj)
+    if hasattr(obj, '__html__'):
+        return str(obj.__html__())
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+def dumps(obj: Any) -> bytes:
+    """
+    Serialize obj to JSON bytes.
+
+    Args:
+        obj: Any JSON-serializable value
+
+    Returns:
+        bytes: UTF-8 encoded JSON
+    """
+    return orjson.dumps(obj, default=_default, option=OPTIONS)
+
+
+class OrjsonProvider(JSONProvider):
+    """Flask JSON provider using orjson. Install with app.json = OrjsonProvider(app)."""
+
+    mimetype = 'application/json'
+
+    def dumps(self, obj: Any, **kwargs: Any) -> str:
+        return dumps(obj).decode('utf-8')
+
+    def loads(self, s, **kwargs: Any) -> Any:
+        return orjson.loads(s)
+
+    def response(self, *args: Any, **kwargs: Any):
+        obj = self._prepare_response_obj(args, kwargs)
+        return self._app.response_class(dumps(obj), mimetype=self.mimetype)
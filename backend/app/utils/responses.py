@@ -6,8 +6,32 @@ Response Format:
     Success: {"success": true, "data": {...}, "meta": {...}}
     Error:   {"success": false, "error": "...", "errors": {...}}
 """
-from flask import jsonify
-from typing import Any, Optional
+from flask import Response, stream_with_context
+from typing import Any, Callable, Iterable, Optional
+
+from app.utils.json_provider import dumps
+
+
+def _json_response(payload: Any) -> Response:
+    """Serialize payload with orjson into an application/json Response."""
+    return Response(dumps(payload), mimetype='application/json')
+
+
+# Pre-serialized bodies for the default error messages (4xx/5xx helpers
+# and app-level error handlers), keyed on (message, status_code)
+_CANNED_ERRORS = {
+    (message, status_code): dumps({"success": False, "error": message})
+    for message, status_code in (
+        ("Bad request", 400),
+        ("Unauthorized", 401),
+        ("Forbidden", 403),
+        ("Resource not found", 404),
+        ("Method not allowed", 405),
+        ("Resource conflict", 409),
+        ("Internal server error", 500),
+        ("An unexpected error occurred", 500),
+    )
+}
 
 
 def success(data: Any = None, meta: dict = None, status_code: int = 200):
@@ -29,7 +53,7 @@ def success(data: Any = None, meta: dict = None, status_code: int = 200):
     response = {"success": True, "data": data}
     if meta:
         response["meta"] = meta
-    return jsonify(response), status_code
+    return _json_response(response), status_code
 
 
 def error(message: str, status_code: int = 400, errors: dict = None):
@@ -48,10 +72,42 @@ def error(message: str, status_code: int = 400, errors: dict = None):
         return error("Invalid request")
         return error("Validation failed", 400, {"email": ["Invalid format"]})
     """
+    if not errors:
+        body = _CANNED_ERRORS.get((message, status_code))
+        if body is not None:
+            return Response(body, mimetype='application/json'), status_code
+
     response = {"success": False, "error": message}
     if errors:
         response["errors"] = errors
-    return jsonify(response), status_code
+    return _json_response(response), status_code
+
+
+def canned_error(message: str, status_code: int) -> Callable[[], Response]:
+    """
+    Build a factory for a fixed error response (for error handlers).
+
+    The body is serialized once here; each call only wraps those bytes
+    in a new Response. A single Response can't be shared across requests
+    because after_request hooks (CORS) set per-request headers on it.
+
+    Args:
+        message: Human-readable error message
+        status_code: HTTP status code
+
+    Returns:
+        Callable returning a Response with the status set
+
+    Example:
+        not_found_response = canned_error("Resource not found", 404)
+        return not_found_response()
+    """
+    body = _CANNED_ERRORS.get((message, status_code)) or dumps({"success": False, "error": message})
+
+    def make_response() -> Response:
+        return Response(body, status=status_code, mimetype='application/json')
+
+    return make_response
 
 
 def created(data: Any = None):
@@ -111,6 +167,27 @@ def paginated(items: list, page: int, per_page: int, total: int):
     )
 
 
+def stream_ndjson(items: Iterable, status_code: int = 200):
+    """
+    Return a streamed NDJSON response (one JSON document per line).
+
+    For large result sets: items are serialized as they are produced,
+    so memory stays constant. Does not use the success envelope.
+
+    Args:
+        items: Iterable of JSON-serializable items (e.g. db.fetch_iter(...))
+        status_code: HTTP status code (default: 200)
+
+    Returns:
+        tuple: (streamed Response, status_code)
+
+    Example:
+        return stream_ndjson(fetch_iter("SELECT * FROM locations"))
+    """
+    lines = (dumps(item) + b'\n' for item in items)
+    return Response(stream_with_context(lines), mimetype='application/x-ndjson'), status_code
+
+
 # ============================================
 # Common error responses
 # ============================================
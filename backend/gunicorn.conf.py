@@ -0,0 +1,31 @@
+"""
+Gunicorn configuration for The Dreamer's Cave backend.
+Loaded automatically by gunicorn when started from backend/.
+
+Usage:
+    gunicorn -w 4 -b 0.0.0.0:$FLASK_PORT wsgi:app
+
+The app is preloaded: create_app (imports, blueprints, error handlers)
+runs once in the master and workers share its memory via fork. MySQL
+sockets and threads can't be shared across processes, so the master
+doesn't open a database pool (DB_POOL_DEFER_INIT) and each worker opens
+its own once it has loaded the app.
+"""
+import os
+
+preload_app = True
+
+# Read by app.config when the app is loaded, which happens after this file
+os.environ.setdefault('DB_POOL_DEFER_INIT', 'true')
+
+
+def when_ready(server):
+    """Master: drop DB connections if a pool was opened anyway before forking workers."""
+    from app.utils.db import close_pool
+    close_pool()
+
+
+def post_worker_init(worker):
+    """Worker: open the DB pool and (after fork) restart the log writer thread."""
+    from app import init_worker
+    init_worker(worker.wsgi)
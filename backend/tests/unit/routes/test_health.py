@@ -0,0 +1,32 @@
+"""
+Unit tests for app.routes.api.health (no database required).
+"""
+import threading
+
+import pytest
+
+from app.routes.api import health
+
+pytestmark = pytest.mark.unit
+
+
+def test_running_probe_is_reused_instead_of_resubmitted(monkeypatch):
+    monkeypatch.setattr(health, '_inflight', {})
+    release = threading.Event()
+    calls = []
+
+    def hung_check():
+        calls.append(1)
+        release.wait(5)
+        return True
+
+    first = health._submit_check('database', hung_check)
+    second = health._submit_check('database', hung_check)
+    release.set()
+
+    assert second is first
+    assert first.result(timeout=5) is True
+    assert calls == [1]
+
+    # Finished probes are not reused
+    assert health._submit_check('database', hung_check) is not first
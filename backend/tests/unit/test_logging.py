@@ -0,0 +1,80 @@
+"""
+Unit tests for the queued logging handler in app/__init__.py.
+"""
+import logging
+import queue
+import threading
+import time
+
+import pytest
+
+from app import _DroppingQueueHandler
+
+pytestmark = pytest.mark.unit
+
+
+def _record(level, msg='msg'):
+    return logging.LogRecord('test', level, __file__, 0, msg, None, None)
+
+
+def test_info_is_dropped_and_counted_when_queue_is_full():
+    log_queue = queue.Queue(maxsize=1)
+    handler = _DroppingQueueHandler(log_queue)
+    handler.handle(_record(logging.INFO, 'first'))
+
+    handler.handle(_record(logging.INFO, 'second'))
+
+    assert handler.dropped == 1
+    assert log_queue.qsize() == 1
+
+
+def test_warning_waits_for_space_instead_of_being_dropped():
+    log_queue = queue.Queue(maxsize=1)
+    handler = _DroppingQueueHandler(log_queue, block_timeout=5)
+    handler.handle(_record(logging.INFO, 'first'))
+
+    # Writer frees a slot shortly after the WARNING starts waiting
+    threading.Timer(0.05, log_queue.get).start()
+    handler.handle(_record(logging.ERROR, 'important'))
+
+    assert handler.dropped == 0
+    assert log_queue.get_nowait().getMessage() == 'important'
+
+
+def test_drops_are_reported_once_the_queue_has_room():
+    log_queue = queue.Queue(maxsize=2)
+    handler = _DroppingQueueHandler(log_queue, block_timeout=0.01)
+    handler.handle(_record(logging.INFO, 'a'))
+    handler.handle(_record(logging.INFO, 'b'))
+    handler.handle(_record(logging.INFO, 'lost'))
+    handler.handle(_record(logging.WARNING, 'lost too'))
+    assert handler.dropped == 2
+
+    log_queue.get_nowait()
+    log_queue.get_nowait()
+    handler.handle(_record(logging.INFO, 'c'))
+
+    messages = [log_queue.get_nowait().getMessage() for _ in range(2)]
+    assert messages == ['c', 'Dropped 2 log records (log queue full)']
+    assert handler.dropped == 0
+
+
+def test_waiting_warning_does_not_block_other_threads():
+    log_queue = queue.Queue(maxsize=1)
+    handler = _DroppingQueueHandler(log_queue, block_timeout=2)
+    handler.handle(_record(logging.INFO, 'fill'))
+
+    waiting = threading.Thread(target=handler.handle, args=(_record(logging.ERROR, 'stuck'),))
+    waiting.start()
+    time.sleep(0.05)  # let the ERROR start waiting for space
+
+    start = time.monotonic()
+    handler.handle(_record(logging.INFO, 'other thread'))
+    elapsed = time.monotonic() - start
+
+    log_queue.get_nowait()  # writer catches up, the ERROR gets in
+    waiting.join(5)
+
+    assert elapsed < 0.5
+    assert handler.dropped == 1
+    assert log_queue.get_nowait().getMessage() == 'stuck'
@@ -0,0 +1,186 @@
+"""
+Unit tests for app.utils.db (no database required).
+"""
+import pytest
+from cachetools import TLRUCache
+from mysql.connector.errors import InternalError
+
+from app.utils import db
+
+pytestmark = pytest.mark.unit
+
+
+class FakeConnection:
+    """Mimics an unbuffered mysql-connector connection with a pending result."""
+
+    def __init__(self, rows):
+        self.rows = list(rows)
+        self.unread_result = False
+        self.fetch_sizes = []
+
+    def cursor(self, dictionary=True, buffered=True):
+        return FakeCursor(self)
+
+
+class FakeCursor:
+    def __init__(self, conn):
+        self.conn = conn
+        self.closed = False
+
+    def execute(self, query, params):
+        self.conn.unread_result = True
+
+    def fetchmany(self, size):
+        self.conn.fetch_sizes.append(size)
+        batch, self.conn.rows = self.conn.rows[:size], self.conn.rows[size:]
+        if not batch:
+            self.conn.unread_result = False
+        return batch
+
+    def close(self):
+        # Same check as MySQLConnection.handle_unread_result without consume_results
+        if self.conn.unread_result:
+            raise InternalError("Unread result found")
+        self.closed = True
+
+
+@pytest.fixture
+def fake_conn(monkeypatch):
+    conn = FakeConnection({'id': i} for i in range(10))
+    monkeypatch.setattr(db, 'get_connection', lambda: conn)
+    return conn
+
+
+def test_fetch_iter_yields_all_rows(fake_conn):
+    rows = list(db.fetch_iter("SELECT id FROM t", arraysize=3))
+
+    assert rows == [{'id': i} for i in range(10)]
+    assert not fake_conn.unread_result
+
+
+def test_fetch_iter_closed_part_way_discards_pending_rows(fake_conn):
+    rows = db.fetch_iter("SELECT id FROM t", arraysize=3)
+    assert next(rows) == {'id': 0}
+
+    # Must not raise "Unread result found"
+    rows.close()
+
+    assert not fake_conn.unread_result
+    assert fake_conn.rows == []
+    # Drained in batches, never the whole result at once
+    assert set(fake_conn.fetch_sizes) == {3}
+
+
+def test_fetch_iter_consumer_error_is_not_replaced(fake_conn):
+    class ConsumerError(Exception):
+        pass
+
+    rows = db.fetch_iter("SELECT id FROM t", arraysize=3)
+    with pytest.raises(ConsumerError):
+        for row in rows:
+            if row['id'] == 4:
+                rows.throw(ConsumerError())
+
+    assert not fake_conn.unread_result
+
+
+@pytest.fixture
+def query_log(monkeypatch):
+    calls = []
+
+    def fake_fetch_all(query, params=None, dictionary=True):
+        calls.append(params)
+        return [{'params': params}]
+
+    monkeypatch.setattr(db, 'fetch_all', fake_fetch_all)
+    db.invalidate()
+    yield calls
+    db.invalidate()
+
+
+def test_fetch_all_cached_keys_dict_params_by_value(query_log):
+    query = "SELECT * FROM locations WHERE id = %(id)s"
+
+    first = db.fetch_all_cached(query, {'id': 1})
+    second = db.fetch_all_cached(query, {'id': 2})
+
+    assert first != second
+    assert query_log == [{'id': 1}, {'id': 2}]
+    assert db.fetch_all_cached(query, {'id': 1}) is first
+
+
+def test_fetch_all_cached_expires_each_entry_on_its_own_ttl(query_log, monkeypatch):
+    now = [1000.0]
+    cache = TLRUCache(maxsize=8, ttu=db._query_cache.ttu, timer=lambda: now[0])
+    monkeypatch.setattr(db, '_query_cache', cache)
+    db.fetch_all_cached("SELECT 1", ttl=10)
+    db.fetch_all_cached("SELECT 2", ttl=100)
+
+    now[0] += 50
+    db.fetch_all_cached("SELECT 1", ttl=10)
+    db.fetch_all_cached("SELECT 2", ttl=100)
+
+    # Only the short-lived entry was re-queried
+    assert len(query_log) == 3
+
+
+def test_test_connection_fails_fast_while_another_probe_holds_the_lock(monkeypatch):
+    monkeypatch.setattr(db, '_db_config', {'host': 'db.invalid'})
+    monkeypatch.setattr(db, 'HEALTH_CONNECT_TIMEOUT', 0.01)
+    connect_calls = []
+    monkeypatch.setattr(db.mysql.connector, 'connect', lambda **kw: connect_calls.append(kw))
+
+    with db._health_lock:
+        assert db.test_connection() is False
+    assert connect_calls == []
+
+
+class FakePool:
+    pool_size = 4
+    _config_version = 'v1'
+
+    def __init__(self):
+        self.added = []
+
+    def add_connection(self, cnx):
+        self.added.append(cnx)
+
+
+def test_sequential_warmup_stops_after_first_failed_connect(monkeypatch):
+    attempts = []
+
+    def failing_connect(db_config):
+        attempts.append(db_config)
+        raise db.mysql.connector.InterfaceError("Can't connect")
+
+    monkeypatch.setattr(db, '_open_warm_connection', failing_connect)
+    pool = FakePool()
+
+    with pytest.raises(db.mysql.connector.InterfaceError):
+        db._warmup_pool(pool, {'host': 'db.invalid'}, parallel=False)
+
+    assert len(attempts) == 1
+    assert pool.added == []
+
+
+def test_sequential_warmup_fills_slots_after_failure_with_placeholders(monkeypatch):
+    outcomes = iter(['warm', db.mysql.connector.InterfaceError("Can't connect")])
+
+    class WarmConnection:
+        pool_config_version = None
+
+    def open_connection(db_config):
+        outcome = next(outcomes)
+        if isinstance(outcome, Exception):
+            raise outcome
+        return WarmConnection()
+
+    monkeypatch.setattr(db, '_open_warm_connection', open_connection)
+    monkeypatch.setattr(db.mysql.connector, 'connect', lambda: 'placeholder')
+    pool = FakePool()
+
+    db._warmup_pool(pool, {'host': 'db.example'}, parallel=False)
+
+    assert isinstance(pool.added[0], WarmConnection)
+    assert pool.added[0].pool_config_version == 'v1'
+    assert pool.added[1:] == ['placeholder'] * 3
@@ -0,0 +1,45 @@
+"""
+Unit tests for app.utils.json_provider and the response envelopes.
+"""
+import decimal
+from datetime import datetime, timezone
+
+import orjson
+import pytest
+
+from app.utils.json_provider import dumps
+from app.utils.responses import error, success
+
+pytestmark = pytest.mark.unit
+
+
+def test_naive_datetime_encoded_as_utc_with_z():
+    assert dumps(datetime(2024, 1, 2, 3, 4, 5)) == b'"2024-01-02T03:04:05Z"'
+
+
+def test_aware_utc_datetime_gets_z():
+    assert dumps(datetime(2024, 1, 2, 3, 4, 5, tzinfo=timezone.utc)) == b'"2024-01-02T03:04:05Z"'
+
+
+def test_decimal_encoded_as_string():
+    assert dumps(decimal.Decimal('1.50')) == b'"1.50"'
+
+
+def _body(response):
+    return orjson.loads(response[0].get_data())
+
+
+def test_success_envelope_omits_empty_meta_and_keeps_datetime_rules():
+    body = _body(success({'at': datetime(2024, 1, 2)}))
+
+    assert body == {'success': True, 'data': {'at': '2024-01-02T00:00:00Z'}}
+
+
+def test_success_envelope_keeps_null_data():
+    assert _body(success()) == {'success': True, 'data': None}
+
+
+def test_error_envelope_includes_errors_when_set():
+    body = _body(error('Invalid', 400, {'name': 'required'}))
+
+    assert body == {'success': False, 'error': 'Invalid', 'errors': {'name': 'required'}}
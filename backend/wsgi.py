@@ -5,6 +5,9 @@ Used by Gunicorn in production.
 Usage:
     gunicorn -w 4 -b 0.0.0.0:$FLASK_PORT wsgi:app
 
+    gunicorn.conf.py enables preload_app: the app below is created once
+    in the master, and each forked worker opens its own DB pool.
+
 Development:
     flask run
     or